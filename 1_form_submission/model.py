@@ -1,7 +1,12 @@
 """Minimal model for this example"""
 
+import re
+
 import pydantic
 
+# Field names submitted by JSON Editor look like "root[name]" or "root[address][city]"
+_ROOT_KEY = re.compile(r"root\[(.*)\]")
+
 
 class Person(pydantic.BaseModel):
     """Example of a person model with simple fields."""
@@ -13,11 +18,6 @@ class Person(pydantic.BaseModel):
     @pydantic.model_validator(mode="before")
     @classmethod
     def json_editor_parse(cls, data):
-        if isinstance(data, dict):
-            out = {}
-            for k, v in data.items():
-                if k.startswith("root[") and k.endswith("]"):
-                    k = k.removeprefix("root[").removesuffix("]")
-                out[k] = v
-            return out
+        if type(data) is dict:
+            return {(m.group(1) if (m := _ROOT_KEY.fullmatch(k)) else k): v for k, v in data.items()}
         return data
@@ -1,6 +1,8 @@
+import itertools
+import time
 import unittest
-from multiprocessing import Process
 from pathlib import Path
+from threading import Thread
 
 import httpx
 import uvicorn
@@ -25,8 +27,9 @@ class TestModel(unittest.TestCase):
 
 
 class TestHTML(unittest.TestCase):
-    def setUp(self) -> None:
-        self.config = Config()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = Config()
 
     def test_home(self):
         html_str = html.html_home("")
@@ -43,7 +46,8 @@ class TestApp(unittest.TestCase):
     def setUp(self) -> None:
         self.app = app.get_app()
         self.client = TestClient(self.app)
-        app.models = []
+        app.models = {}
+        app.next_id = itertools.count()
 
     def test_home_page_empty(self):
         response = self.client.get("/")
@@ -52,10 +56,10 @@ class TestApp(unittest.TestCase):
         self.assertIn("New", response.text)
 
     def test_home_page_dummy(self):
-        app.models = [
-            model.Person(name="John Doe", age=30, job="Developer"),
-            model.Person(name="Jane Smith", age=25, job="UX Designer"),
-        ]
+        app.models = {
+            0: model.Person(name="John Doe", age=30, job="Developer"),
+            1: model.Person(name="Jane Smith", age=25, job="UX Designer"),
+        }
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
         self.assertIn("People", response.text)
@@ -74,10 +78,10 @@ class TestApp(unittest.TestCase):
         self.assertEqual(len(app.models), 2)
 
     def test_get_page(self):
-        app.models = [
-            model.Person(name="John Doe", age=30, job="Developer"),
-            model.Person(name="Jane Smith", age=25, job="UX Designer"),
-        ]
+        app.models = {
+            0: model.Person(name="John Doe", age=30, job="Developer"),
+            1: model.Person(name="Jane Smith", age=25, job="UX Designer"),
+        }
         response = self.client.get("/0")
         self.assertEqual(response.status_code, 200)
         self.assertIn("John Doe", response.text)
@@ -89,10 +93,10 @@ class TestApp(unittest.TestCase):
         self.assertIn("Not Found", response.text)
 
     def test_edit_page(self):
-        app.models = [
-            model.Person(name="John Doe", age=30, job="Developer"),
-            model.Person(name="Jane Smith", age=25, job="UX Designer"),
-        ]
+        app.models = {
+            0: model.Person(name="John Doe", age=30, job="Developer"),
+            1: model.Person(name="Jane Smith", age=25, job="UX Designer"),
+        }
         response = self.client.post("/0", data={"name": "John Smith", "age": 31, "job": "Programmer"})
         self.assertEqual(response.status_code, 200)
         self.assertIn("John Smith", response.text)
@@ -101,46 +105,65 @@ class TestApp(unittest.TestCase):
         self.assertIn("Jane Doe", response.text)
         self.assertEqual(
             app.models,
-            [
-                model.Person(name="John Smith", age=31, job="Programmer"),
-                model.Person(name="Jane Doe", age=26, job="UI Designer"),
-            ],
+            {
+                0: model.Person(name="John Smith", age=31, job="Programmer"),
+                1: model.Person(name="Jane Doe", age=26, job="UI Designer"),
+            },
         )
 
 
 class TestInteraction(unittest.TestCase):
-    @staticmethod
-    def run_server():
-        uvicorn.run(app.get_app(), log_level="info")
+    @classmethod
+    def setUpClass(cls) -> None:
+        (Path(__file__).parent / "results").mkdir(exist_ok=True)
+        # Run the server in this process so each test can reset the stored models
+        cls.server = uvicorn.Server(uvicorn.Config(app.get_app(), log_level="info"))
+        cls.server_thread = Thread(target=cls.server.run, daemon=True)
+        cls.server_thread.start()
+        cls.addClassCleanup(cls.stop_server)
+        # Give up if the server thread dies, e.g. because the port is already in use
+        deadline = time.monotonic() + 10
+        while not cls.server.started:
+            if not cls.server_thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        cls.playwright = sync_playwright().start()
+        cls.addClassCleanup(cls.playwright.stop)
+        cls.browser = cls.playwright.chromium.launch()
+        cls.addClassCleanup(cls.browser.close)
+
+    @classmethod
+    def stop_server(cls) -> None:
+        cls.server.should_exit = True
+        cls.server_thread.join()
 
     def setUp(self) -> None:
-        (Path(__file__).parent / "results").mkdir(exist_ok=True)
-        self.proc = Process(target=self.run_server, args=(), daemon=True)
-        self.proc.start()
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.firefox.launch()
+        app.models = {}
+        app.next_id = itertools.count()
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
         self.page.set_viewport_size({"width": 500, "height": 500})
+        self.http = httpx.Client(
+            base_url="http://127.0.0.1:8000",
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
 
     def tearDown(self) -> None:
-        self.browser.close()
-        self.playwright.stop()
-        self.proc.kill()
+        self.http.close()
+        self.context.close()
 
     def load_dummy_data(self):
         """Add some data for working with"""
-        with httpx.Client(base_url="http://127.0.0.1:8000") as client:
-            response = client.post(
-                url="/",
-                data={"name": "John Doe", "age": 30, "job": "Developer"},
-            )
-            self.assertEqual(response.status_code, 200)
-            response = client.post(
-                url="/",
-                data={"name": "Jane Smith", "age": 25, "job": "UX Designer"},
-            )
-            self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={"name": "John Doe", "age": 30, "job": "Developer"},
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={"name": "Jane Smith", "age": 25, "job": "UX Designer"},
+        )
+        self.assertEqual(response.status_code, 200)
 
     def test_home_page(self):
         self.page.goto("http://127.0.0.1:8000/")
@@ -1,5 +1,6 @@
 """FastAPI app for running example"""
 
+import itertools
 from pathlib import Path
 from typing import Annotated
 
@@ -12,41 +13,40 @@ import html
 from model import Person, Address
 
 # Global state, this would be in a database for real world usage
-models = []
+models: dict[int, Person] = {}
+next_id = itertools.count()
 
 
 def get_app():
     app = fastapi.FastAPI()
 
     @app.get("/")
-    async def people() -> HTMLResponse:
+    def people() -> HTMLResponse:
         """List all existing people and provide a form for creating a new person."""
         return HTMLResponse(
-            html.html_home("".join(html.html_person(m, i) for i, m in enumerate(models))),
+            html.html_home("".join([html.html_person(m, i) for i, m in models.items()])),
         )
 
     @app.post("/")
-    async def create_person(model: Annotated[Person, fastapi.Form()]) -> HTMLResponse:
+    def create_person(model: Annotated[Person, fastapi.Form()]) -> HTMLResponse:
         """Receive a new person request and store it."""
-        models.append(model)
-        return await people()
+        models[next(next_id)] = model
+        return people()
 
     @app.get("/{index}")
-    async def person(index: int) -> HTMLResponse:
+    def person(index: int) -> HTMLResponse:
         """Show an edit form for an existing person."""
-        try:
-            model = models[index]
-        except IndexError:
+        model = models.get(index)
+        if model is None:
             return HTMLResponse(status_code=404, content="Not Found")
         return HTMLResponse(html.html_edit(model, index))
 
     @app.post("/{index}")
-    async def update_person(index: int, model: Annotated[Person, fastapi.Form()]) -> HTMLResponse:
+    def update_person(index: int, model: Annotated[Person, fastapi.Form()]) -> HTMLResponse:
         """Receive an updated person request and update the existing entry."""
-        try:
-            models[index] = model
-        except IndexError:
+        if index not in models:
             return HTMLResponse(status_code=404, content="Not Found")
+        models[index] = model
         return HTMLResponse(html.html_edit(model, index))
 
     # Mount static files if we've created the static directory
@@ -59,29 +59,25 @@ def get_app():
 
 def main():
     # Create dummy data
-    models.append(
-        Person(
-            name="John Doe",
-            age=30,
-            job="UX",
-            address=Address(
-                house_number=123,
-                street="Main St",
-                city="New York",
-            ),
-        )
+    models[next(next_id)] = Person(
+        name="John Doe",
+        age=30,
+        job="UX",
+        address=Address(
+            house_number=123,
+            street="Main St",
+            city="New York",
+        ),
     )
-    models.append(
-        Person(
-            name="Jane Smith",
-            age=25,
-            job="Designer",
-            address=Address(
-                house_number=4,
-                street="5th Ave",
-                city="San Francisco",
-            ),
-        )
+    models[next(next_id)] = Person(
+        name="Jane Smith",
+        age=25,
+        job="Designer",
+        address=Address(
+            house_number=4,
+            street="5th Ave",
+            city="San Francisco",
+        ),
     )
     # Start the FastAPI app
     uvicorn.run(get_app(), log_level="info", use_colors=True)
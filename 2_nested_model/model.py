@@ -1,14 +1,11 @@
 """Minimal model for this example"""
 
-import pydantic
-
+import re
 
-class NestedDict(dict):
-    """Dictionary which automatically creates nested dictionaries when accessing missing keys."""
+import pydantic
 
-    def __missing__(self, key):
-        value = self[key] = NestedDict()
-        return value
+# Field names submitted by JSON Editor look like "root[name]" or "root[address][city]"
+_ROOT_KEY = re.compile(r"root\[(.*)\]")
 
 
 class Address(pydantic.BaseModel):
@@ -30,15 +27,14 @@ class Person(pydantic.BaseModel):
     @pydantic.model_validator(mode="before")
     @classmethod
     def json_editor_parse(cls, data):
-        if isinstance(data, dict):
-            out = NestedDict()
+        if type(data) is dict:
+            out = {}
             for k, v in data.items():
-                if k.startswith("root[") and k.endswith("]"):
+                if m := _ROOT_KEY.fullmatch(k):
                     parent = out
-                    *sub_ks, leaf = k.removeprefix("root[").removesuffix("]").split("][")
-                    while sub_ks:
-                        sub_k = sub_ks.pop(0)
-                        parent = parent[sub_k]
+                    *sub_ks, leaf = m.group(1).split("][")
+                    for sub_k in sub_ks:
+                        parent = parent.setdefault(sub_k, {})
                     parent[leaf] = v
                 else:
                     out[k] = v
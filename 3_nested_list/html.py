@@ -3,117 +3,153 @@
 You can use anything you want to generate the HTML, this is just a simple example.
 """
 
-import json
 from pathlib import Path
-from textwrap import dedent, indent
+from textwrap import dedent
+
+import pydantic_core
 
 from model import Person, Address
 
+# Resolved once at import, these don't change between requests
+_JSONEDITOR_SRC = (
+    "/static/jsoneditor.min.js"
+    if (Path(__file__).parent.parent / "static").is_dir()
+    else "https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/jsoneditor.min.js"
+)
+_PERSON_SCHEMA_JSON = pydantic_core.to_json(Person.model_json_schema()).decode()
+
+# Templates are dedented once at import and filled in with %-formatting on each request
+_TEMPLATE = dedent("""\
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <title>%(title)s</title>
+        <meta name="description" content="A simple web application for demonstrating JSON Editor and FastAPI integration">
+        <meta name="keywords" content="JSON Editor, FastAPI, Python">
+        <!-- Include JSON Editor -->
+        <script src="%(src)s"></script>
+    </head>
+    <body>
+        %(content)s
+    </body>
+    </html>
+    """)
+
+_HOME = dedent("""\
+    <div>
+        <h2>People</h2>
+        %(content)s
+    </div>
+    <h2>New</h2>
+    <form method="post" action="/">
+        <div id="new-person">
+            <!-- Inject the JSON Editor here, using the JSON Schema from the Person model -->
+            <script>
+                var editor = new JSONEditor(
+                    document.getElementById('new-person'),
+                    {
+                        disable_collapse: true,
+                        disable_edit_json: true,
+                        disable_properties: true,
+                        schema: %(schema)s
+                    },
+                );
+            </script>
+        </div>
+        <input type="submit" value="Create"></input>
+    </form>
+    """)
+
+_ADDRESS = dedent("""\
+    <p>Address: %(house_number)s %(street)s, %(city)s</p>
+    """)
+
+_HOBBIES = dedent("""\
+    <p>Hobbies:
+        <ul>
+    %s
+        </ul>
+    </p>
+    """)
+_HOBBY = "        <li>%s</li>"
+
+_PERSON = dedent("""\
+    <div>
+        <h2><a href="/%d">%s</a></h2>
+        <p>Age: %d</p>
+        <p>Job: %s</p>
+        %s
+    </div>
+    """)
+
+_EDIT = dedent("""\
+    <h2>Edit</h2>
+    <form method="post" action="/%(index)s">
+        <div id="edit-person">
+            <!-- Inject the JSON Editor here, using the JSON Schema from the Person model -->
+            <!-- and initial data from the Person instance -->
+            <script>
+                var editor = new JSONEditor(
+                    document.getElementById('edit-person'),
+                    {
+                        disable_collapse: true,
+                        disable_edit_json: true,
+                        disable_properties: true,
+                        schema: %(schema)s,
+                        startval: %(startval)s
+                    },
+                );
+            </script>
+        </div>
+        <input type="submit" value="Update"></input>
+    </form>
+    """)
+
+
+def _indent(content: str, level: int) -> str:
+    """Indent all but the first line of content, the template already positions the first line."""
+    return content.rstrip("\n").replace("\n", "\n" + " " * level)
+
 
 def _template(title: str, content: str) -> str:
-    return dedent(f"""\
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <title>{title}</title>
-            <meta name="description" content="A simple web application for demonstrating JSON Editor and FastAPI integration">
-            <meta name="keywords" content="JSON Editor, FastAPI, Python">
-            <!-- Include JSON Editor -->
-            <script src="{"/static/jsoneditor.min.js" if (Path(__file__).parent.parent / "static").is_dir() else "https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/jsoneditor.min.js"}"></script>
-        </head>
-        <body>
-            {indent(content, " " * 4)}
-        </body>
-        </html>
-        """)
+    return _TEMPLATE % {"title": title, "src": _JSONEDITOR_SRC, "content": _indent(content, 4)}
+
+
+# Whole pages are rendered once with placeholders and split into their static chunks, so that each request
+# only has to join the chunks with its own values. NUL can't appear in the JSON schema, it would be escaped.
+_SLOT = "\0"
+_HOME_START, _HOME_END = _template("People", _HOME % {"content": _SLOT, "schema": _PERSON_SCHEMA_JSON}).split(_SLOT)
+_EDIT_START, _EDIT_INDEX, _EDIT_STARTVAL, _EDIT_END = _template(
+    _SLOT, _EDIT % {"index": _SLOT, "schema": _PERSON_SCHEMA_JSON, "startval": _SLOT}
+).split(_SLOT)
 
 
 def html_home(content: str) -> str:
     """Home page with list of existing models and form for creating new models."""
-    return _template(
-        "People",
-        dedent(f"""\
-            <div>
-                <h2>People</h2>
-                {indent(content, " " * 4)}
-            </div>
-            <h2>New</h2>
-            <form method="post" action="/">
-                <div id="new-person">
-                    <!-- Inject the JSON Editor here, using the JSON Schema from the Person model -->
-                    <script>
-                        var editor = new JSONEditor(
-                            document.getElementById('new-person'),
-                            {{
-                                disable_collapse: true,
-                                disable_edit_json: true,
-                                disable_properties: true,
-                                schema: {json.dumps(Person.model_json_schema())}
-                            }},
-                        );
-                    </script>
-                </div>
-                <input type="submit" value="Create"></input>
-            </form>
-        """),
-    )
+    return f"{_HOME_START}{_indent(content, 8)}{_HOME_END}"
 
 
 def html_address(address: Address) -> str:
     """Snippet for displaying an address."""
-    return dedent(f"""\
-        <p>Address: {address.house_number} {address.street}, {address.city}</p>
-        """)
+    return _ADDRESS % {"house_number": address.house_number, "street": address.street, "city": address.city}
 
 
 def html_hobbies(hobbies: list[str]) -> str:
     """Snippet for displaying a list of hobbies."""
-    return dedent(f"""\
-        <p>Hobbies:
-            <ul>
-                {indent("\n".join(f"<li>{hobby}</li>" for hobby in hobbies), " " * 12)}
-            </ul>
-        </p>
-        """)
+    return _HOBBIES % "\n".join([_HOBBY % hobby for hobby in hobbies])
 
 
 def html_person(person: Person, index: int) -> str:
     """Snippet for listing a single person."""
-    return dedent(f"""\
-        <div>
-            <h2><a href="/{index}">{person.name}</a></h2>
-            <p>Age: {person.age}</p>
-            <p>Job: {person.job}</p>
-            {html_address(person.address) if person.address else ""}
-            {html_hobbies(person.hobbies) if person.hobbies else ""}
-        </div>
-        """)
+    details = "".join(
+        (
+            html_address(person.address) if person.address else "",
+            html_hobbies(person.hobbies) if person.hobbies else "",
+        )
+    )
+    return _PERSON % (index, person.name, person.age, person.job, _indent(details, 4))
 
 
 def html_edit(person: Person, index: int) -> str:
     """Page to edit an existing person, pre-filled with existing data."""
-    return _template(
-        person.name,
-        dedent(f"""\
-            <h2>Edit</h2>
-            <form method="post" action="/{index}">
-                <div id="edit-person">
-                    <!-- Inject the JSON Editor here, using the JSON Schema from the Person model -->
-                    <!-- and initial data from the Person instance -->
-                    <script>
-                        var editor = new JSONEditor(
-                            document.getElementById('edit-person'),
-                            {{
-                                disable_collapse: true,
-                                disable_edit_json: true,
-                                disable_properties: true,
-                                schema: {json.dumps(Person.model_json_schema())},
-                                startval: {person.model_dump_json()}
-                            }},
-                        );
-                    </script>
-                </div>
-                <input type="submit" value="Update"></input>
-            </form>
-            """),
-    )
+    return f"{_EDIT_START}{person.name}{_EDIT_INDEX}{index}{_EDIT_STARTVAL}{person.model_dump_json()}{_EDIT_END}"
@@ -1,39 +1,24 @@
 """Minimal model for this example"""
 
-import pydantic
-
+import re
 
-def indexed_dicts_to_lists(d):
-    if not isinstance(d, dict):
-        # Leaf node
-        return d
-    if d and all(sub_k.isdigit() for sub_k in d.keys()):
-        # Top level list
-        return [indexed_dicts_to_lists(sub_v) for sub_v in d.values()]
-    # Otherwise, we've got to iterate through a nested dictionary/list combination
-    result = {}
-    for k, v in d.items():
-        if isinstance(v, dict) and all(sub_k.isdigit() for sub_k in v.keys()):
-            # Nested list
-            result[k] = [indexed_dicts_to_lists(sub_v) for sub_v in v.values()]
-        elif isinstance(v, dict):
-            # Nested dictionary
-            result[k] = indexed_dicts_to_lists(v)
-        elif isinstance(v, list):
-            # Nested default list
-            result[k] = [indexed_dicts_to_lists(sub_v) for sub_v in v]
-        else:
-            # Leaf node
-            result[k] = v
-    return result
+import pydantic
 
+# Field names submitted by JSON Editor look like "root[name]" or "root[address][city]"
+_ROOT_KEY = re.compile(r"root\[(.*)\]")
 
-class NestedDict(dict):
-    """Dictionary which automatically creates nested dictionaries when accessing missing keys."""
 
-    def __missing__(self, key):
-        value = self[key] = NestedDict()
-        return value
+def list_index(parent: list, key: str) -> int:
+    """Convert a JSON Editor key into an index for parent, adding a None placeholder when it starts a new item."""
+    if not key.isdigit():
+        raise ValueError("List index must be a number")
+    index = int(key)
+    if index > len(parent):
+        # Only allow the next item, so a large index can't allocate a huge list
+        raise ValueError("List index must not skip items")
+    if index == len(parent):
+        parent.append(None)
+    return index
 
 
 class Address(pydantic.BaseModel):
@@ -56,38 +41,26 @@ class Person(pydantic.BaseModel):
     @pydantic.model_validator(mode="before")
     @classmethod
     def json_editor_parse(cls, data):
-        if isinstance(data, dict):
-            out = NestedDict()
+        if type(data) is dict:
+            out = {}
             for k, v in data.items():
-                if k.startswith("root[") and k.endswith("]"):
+                if m := _ROOT_KEY.fullmatch(k):
                     parent = out
-                    *sub_ks, leaf = k.removeprefix("root[").removesuffix("]").split("][")
-                    while sub_ks:
-                        sub_k = sub_ks.pop(0)
+                    *sub_ks, leaf = m.group(1).split("][")
+                    for sub_k, next_k in zip(sub_ks, [*sub_ks[1:], leaf]):
                         if isinstance(parent, list):
-                            # Handle field with default list already created
-                            if not sub_k.isdigit():
-                                raise ValueError("List index must be a number")
-                            if sub_ks and sub_ks[0].isdigit():
-                                sub_type = list
-                            else:
-                                sub_type = NestedDict
-                            while len(parent) <= int(sub_k):
-                                parent.append(sub_type())
-                            parent = parent[int(sub_k)]
+                            sub_k = list_index(parent, sub_k)
+                            child = parent[sub_k]
                         else:
-                            parent = parent[sub_k]
+                            child = parent.get(sub_k)
+                        if child is None:
+                            # Numeric keys are list indices, so look ahead to pick the right container
+                            child = parent[sub_k] = [] if next_k.isdigit() else {}
+                        parent = child
                     if isinstance(parent, list):
-                        # Handle field with default list already created
-                        if not leaf.isdigit():
-                            raise ValueError("List index must be a number")
-                        while len(parent) <= int(leaf):
-                            parent.append(type(v)())
-                        parent[int(leaf)] = v
-                    else:
-                        parent[leaf] = v
+                        leaf = list_index(parent, leaf)
+                    parent[leaf] = v
                 else:
                     out[k] = v
-            done = indexed_dicts_to_lists(out)
-            return done
+            return out
         return data
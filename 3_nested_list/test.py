@@ -1,6 +1,8 @@
+import itertools
+import time
 import unittest
-from multiprocessing import Process
 from pathlib import Path
+from threading import Thread
 
 import httpx
 import uvicorn
@@ -42,8 +44,9 @@ class TestModel(unittest.TestCase):
 
 
 class TestHTML(unittest.TestCase):
-    def setUp(self) -> None:
-        self.config = Config()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = Config()
 
     def test_home(self):
         html_str = html.html_home("")
@@ -60,7 +63,8 @@ class TestApp(unittest.TestCase):
     def setUp(self) -> None:
         self.app = app.get_app()
         self.client = TestClient(self.app)
-        app.models = []
+        app.models = {}
+        app.next_id = itertools.count()
 
     def test_home_page_empty(self):
         response = self.client.get("/")
@@ -69,8 +73,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("New", response.text)
 
     def test_home_page_dummy(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -84,7 +88,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -98,7 +102,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
         self.assertIn("People", response.text)
@@ -142,9 +146,35 @@ class TestApp(unittest.TestCase):
         self.assertIn("Jane Smith", response.text)
         self.assertEqual(len(app.models), 2)
 
+    def test_create_list_in_order(self):
+        response = self.client.post(
+            "/",
+            data={
+                "name": "John Doe",
+                "age": 30,
+                "root[hobbies][0]": "Walking",
+                "root[hobbies][1]": "Reading",
+                "root[hobbies][2]": "Cooking",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(app.models[0].hobbies, ["Walking", "Reading", "Cooking"])
+
+    def test_create_list_invalid_index(self):
+        for hobbies, msg in (
+            ({"root[hobbies][5]": "Walking"}, "List index must not skip items"),
+            ({"root[hobbies][1]": "Reading", "root[hobbies][0]": "Walking"}, "List index must not skip items"),
+            ({"root[hobbies][first]": "Walking"}, "List index must be a number"),
+        ):
+            with self.subTest(hobbies=hobbies):
+                response = self.client.post("/", data={"name": "John Doe", "age": 30, **hobbies})
+                self.assertEqual(response.status_code, 422)
+                self.assertIn(msg, response.json()["detail"][0]["msg"])
+        self.assertEqual(len(app.models), 0)
+
     def test_get_page(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -158,7 +188,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -172,7 +202,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.get("/0")
         self.assertEqual(response.status_code, 200)
         self.assertIn("John Doe", response.text)
@@ -186,8 +216,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("Not Found", response.text)
 
     def test_edit_page(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -201,7 +231,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -215,7 +245,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.post(
             "/0",
             data={
@@ -246,8 +276,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("Jane Doe", response.text)
         self.assertEqual(
             app.models,
-            [
-                model.Person(
+            {
+                0: model.Person(
                     name="John Smith",
                     age=31,
                     job="Programmer",
@@ -260,7 +290,7 @@ class TestApp(unittest.TestCase):
                         city="New York",
                     ),
                 ),
-                model.Person(
+                1: model.Person(
                     name="Jane Doe",
                     age=26,
                     job="UI Designer",
@@ -273,61 +303,80 @@ class TestApp(unittest.TestCase):
                         city="New York",
                     ),
                 ),
-            ],
+            },
         )
 
 
 class TestInteraction(unittest.TestCase):
-    @staticmethod
-    def run_server():
-        uvicorn.run(app.get_app(), log_level="info")
+    @classmethod
+    def setUpClass(cls) -> None:
+        (Path(__file__).parent / "results").mkdir(exist_ok=True)
+        # Run the server in this process so each test can reset the stored models
+        cls.server = uvicorn.Server(uvicorn.Config(app.get_app(), log_level="info"))
+        cls.server_thread = Thread(target=cls.server.run, daemon=True)
+        cls.server_thread.start()
+        cls.addClassCleanup(cls.stop_server)
+        # Give up if the server thread dies, e.g. because the port is already in use
+        deadline = time.monotonic() + 10
+        while not cls.server.started:
+            if not cls.server_thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        cls.playwright = sync_playwright().start()
+        cls.addClassCleanup(cls.playwright.stop)
+        cls.browser = cls.playwright.chromium.launch()
+        cls.addClassCleanup(cls.browser.close)
+
+    @classmethod
+    def stop_server(cls) -> None:
+        cls.server.should_exit = True
+        cls.server_thread.join()
 
     def setUp(self) -> None:
-        (Path(__file__).parent / "results").mkdir(exist_ok=True)
-        self.proc = Process(target=self.run_server, args=(), daemon=True)
-        self.proc.start()
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.firefox.launch()
+        app.models = {}
+        app.next_id = itertools.count()
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
         self.page.set_viewport_size({"width": 500, "height": 500})
+        self.http = httpx.Client(
+            base_url="http://127.0.0.1:8000",
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
 
     def tearDown(self) -> None:
-        self.browser.close()
-        self.playwright.stop()
-        self.proc.kill()
+        self.http.close()
+        self.context.close()
 
     def load_dummy_data(self):
         """Add some data for working with"""
-        with httpx.Client(base_url="http://127.0.0.1:8000") as client:
-            response = client.post(
-                url="/",
-                data={
-                    "name": "John Doe",
-                    "age": 30,
-                    "job": "Developer",
-                    "root[hobbies][0]": "Walking",
-                    "root[hobbies][1]": "Reading",
-                    "root[address][house_number]": 456,
-                    "root[address][street]": "Odd St",
-                    "root[address][city]": "New York",
-                },
-            )
-            self.assertEqual(response.status_code, 200)
-            response = client.post(
-                url="/",
-                data={
-                    "name": "Jane Smith",
-                    "age": 25,
-                    "job": "UX Designer",
-                    "root[hobbies][0]": "Skiing",
-                    "root[hobbies][1]": "Snowboarding",
-                    "root[address][house_number]": 5,
-                    "root[address][street]": "Main St",
-                    "root[address][city]": "New York",
-                },
-            )
-            self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={
+                "name": "John Doe",
+                "age": 30,
+                "job": "Developer",
+                "root[hobbies][0]": "Walking",
+                "root[hobbies][1]": "Reading",
+                "root[address][house_number]": 456,
+                "root[address][street]": "Odd St",
+                "root[address][city]": "New York",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={
+                "name": "Jane Smith",
+                "age": 25,
+                "job": "UX Designer",
+                "root[hobbies][0]": "Skiing",
+                "root[hobbies][1]": "Snowboarding",
+                "root[address][house_number]": 5,
+                "root[address][street]": "Main St",
+                "root[address][city]": "New York",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
 
     def test_home_page(self):
         self.page.goto("http://127.0.0.1:8000/")
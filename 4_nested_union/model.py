@@ -1,51 +1,72 @@
 """Minimal model for this example"""
 
 import datetime
+import functools
+import itertools
+import re
 from typing import Annotated
-from typing import Any
+from typing import Literal
 from typing import Union
 
 import pydantic
 from pydantic_core import core_schema as cs
 
+# Field names submitted by JSON Editor look like "root[name]" or "root[address][city]"
+_ROOT_KEY = re.compile(r"root\[(.*)\]")
 
-def indexed_dicts_to_lists(d):
-    if not isinstance(d, dict):
-        # Leaf node
-        return d
-    if d and all(sub_k.isdigit() for sub_k in d.keys()):
-        # Top level list
-        return [indexed_dicts_to_lists(sub_v) for sub_v in d.values()]
-    # Otherwise, we've got to iterate through a nested dictionary/list combination
-    result = {}
-    for k, v in d.items():
-        if isinstance(v, dict) and all(sub_k.isdigit() for sub_k in v.keys()):
-            # Nested list
-            result[k] = [indexed_dicts_to_lists(sub_v) for sub_v in v.values()]
-        elif isinstance(v, dict):
-            # Nested dictionary
-            result[k] = indexed_dicts_to_lists(v)
-        elif isinstance(v, list):
-            # Nested default list
-            result[k] = [indexed_dicts_to_lists(sub_v) for sub_v in v]
-        else:
-            # Leaf node
-            result[k] = v
-    return result
+
+def _split_key(k: str) -> tuple[str, ...] | None:
+    if m := _ROOT_KEY.fullmatch(k):
+        return tuple(m.group(1).split("]["))
+    return None
+
+
+# Field names come from the client, so only short ones are cached to keep the cache small
+_MAX_CACHED_KEY = 100
+_split_short_key = functools.lru_cache(maxsize=1024)(_split_key)
 
 
-def get_discriminator_value(v: Any) -> str | None:
-    if isinstance(v, dict):
-        return v.get("_type", None)
-    return getattr(v, "_type", None)
+def split_key(k: str) -> tuple[str, ...] | None:
+    """Split a JSON Editor field name into its keys, cached as every form submits the same field names."""
+    return _split_short_key(k) if len(k) <= _MAX_CACHED_KEY else _split_key(k)
 
 
-class NestedDict(dict):
-    """Dictionary which automatically creates nested dictionaries when accessing missing keys."""
+def list_index(parent: list, key: str) -> int:
+    """Convert a JSON Editor key into an index for parent, adding a None placeholder when it starts a new item."""
+    if not key.isdigit():
+        raise ValueError("List index must be a number")
+    index = int(key)
+    if index > len(parent):
+        # Only allow the next item, so a large index can't allocate a huge list
+        raise ValueError("List index must not skip items")
+    if index == len(parent):
+        parent.append(None)
+    return index
 
-    def __missing__(self, key):
-        value = self[key] = NestedDict()
-        return value
+
+def parse_form_keys(data: dict) -> dict:
+    """Nest the values of JSON Editor field names like "root[address][city]", leaving other names as they are."""
+    out = {}
+    for k, v in data.items():
+        if keys := split_key(k):
+            parent = out
+            for sub_k, next_k in itertools.pairwise(keys):
+                if isinstance(parent, list):
+                    sub_k = list_index(parent, sub_k)
+                    child = parent[sub_k]
+                else:
+                    child = parent.get(sub_k)
+                if child is None:
+                    # Numeric keys are list indices, so look ahead to pick the right container
+                    child = parent[sub_k] = [] if next_k.isdigit() else {}
+                parent = child
+            leaf = keys[-1]
+            if isinstance(parent, list):
+                leaf = list_index(parent, leaf)
+            parent[leaf] = v
+        else:
+            out[k] = v
+    return out
 
 
 class Address(pydantic.BaseModel):
@@ -59,7 +80,11 @@ class Address(pydantic.BaseModel):
 class Contact(pydantic.BaseModel):
     """Example of a contact model with simple fields."""
 
+    model_config = pydantic.ConfigDict(serialize_by_alias=True)
+
     name: str
+    # Field names starting with an underscore are private in Pydantic, so "_type" is an alias
+    type_: Literal["Contact"] = pydantic.Field("Contact", alias="_type")
 
     @classmethod
     def __get_pydantic_json_schema__(
@@ -67,35 +92,36 @@ class Contact(pydantic.BaseModel):
     ) -> pydantic.json_schema.JsonSchemaValue:
         json_schema = handler(core_schema)
         json_schema = handler.resolve_ref_schema(json_schema)
-        json_schema["properties"]["_type"] = {
+        # Return a new schema rather than editing the one Pydantic generated
+        type_schema = {
             "enum": [cls.__name__],
             "default": cls.__name__,
             "type": "string",
             "title": "Type of contact",
         }
-        return json_schema
-
-    @pydantic.computed_field
-    @property
-    def _type(self) -> str:
-        return self.__class__.__name__
-
-    @_type.setter
-    def _type(self, v: str) -> None:
-        if v != self.__class__.__name__:
-            raise ValueError(f"Incorrectly loading a {v} as {self.__class__.__name__} object")
-        raise ValueError("Cannot set _type attribute directly")
+        # Move _type last, so the form shows the redundant type select after the contact's own fields
+        properties = {k: v for k, v in json_schema["properties"].items() if k != "_type"}
+        return {**json_schema, "properties": {**properties, "_type": type_schema}}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Tag each contact type with its own class name before Pydantic collects the fields
+        cls.__annotations__["type_"] = Literal[cls.__name__]
+        cls.type_ = pydantic.Field(cls.__name__, alias="_type")
+        # A new contact type changes the subclass tree, so forget the cached results
+        Contact.get_subclasses.cache_clear()
 
     @classmethod
+    @functools.cache
     def get_subclasses(cls, include_self=True):
-        if include_self:
-            yield cls
-        for subclass in cls.__subclasses__():
-            yield from subclass.get_subclasses()
-
-    @classmethod
-    def get_annotated_subclass_types(cls, include_self=True):
-        return (Annotated[c, pydantic.Tag(c.__name__)] for c in cls.get_subclasses(include_self=include_self))
+        subclasses = []
+        stack = [cls] if include_self else cls.__subclasses__()[::-1]
+        while stack:
+            subclass = stack.pop()
+            subclasses.append(subclass)
+            # Reversed so the stack yields subclasses depth first, in the order they were defined
+            stack.extend(reversed(subclass.__subclasses__()))
+        return tuple(subclasses)
 
 
 class Friend(Contact):
@@ -110,6 +136,9 @@ class FamilyMember(Contact):
     relationship: str
 
 
+AnyContact = Annotated[Union[*Contact.get_subclasses()], pydantic.Discriminator("type_")]
+
+
 class Person(pydantic.BaseModel):
     """Example of a person model with simple fields."""
 
@@ -118,48 +147,11 @@ class Person(pydantic.BaseModel):
     job: str = "Developer"
     address: Address | None = None
     hobbies: list[str] = pydantic.Field(default_factory=list)
-    contacts: list[
-        Annotated[
-            Union[*Contact.get_annotated_subclass_types()],
-            pydantic.Discriminator(get_discriminator_value),
-        ]
-    ] = pydantic.Field(default_factory=list)
+    contacts: list[AnyContact] = pydantic.Field(default_factory=list)
 
     @pydantic.model_validator(mode="before")
     @classmethod
     def json_editor_parse(cls, data):
-        if isinstance(data, dict):
-            out = NestedDict()
-            for k, v in data.items():
-                if k.startswith("root[") and k.endswith("]"):
-                    parent = out
-                    *sub_ks, leaf = k.removeprefix("root[").removesuffix("]").split("][")
-                    while sub_ks:
-                        sub_k = sub_ks.pop(0)
-                        if isinstance(parent, list):
-                            # Handle field with default list already created
-                            if not sub_k.isdigit():
-                                raise ValueError("List index must be a number")
-                            if sub_ks and sub_ks[0].isdigit():
-                                sub_type = list
-                            else:
-                                sub_type = NestedDict
-                            while len(parent) <= int(sub_k):
-                                parent.append(sub_type())
-                            parent = parent[int(sub_k)]
-                        else:
-                            parent = parent[sub_k]
-                    if isinstance(parent, list):
-                        # Handle field with default list already created
-                        if not leaf.isdigit():
-                            raise ValueError("List index must be a number")
-                        while len(parent) <= int(leaf):
-                            parent.append(type(v)())
-                        parent[int(leaf)] = v
-                    else:
-                        parent[leaf] = v
-                else:
-                    out[k] = v
-            done = indexed_dicts_to_lists(out)
-            return done
+        if type(data) is dict:
+            return parse_form_keys(data)
         return data
@@ -1,7 +1,9 @@
 import datetime
+import itertools
+import time
 import unittest
-from multiprocessing import Process
 from pathlib import Path
+from threading import Thread
 
 import httpx
 import uvicorn
@@ -58,8 +60,9 @@ class TestModel(unittest.TestCase):
 
 
 class TestHTML(unittest.TestCase):
-    def setUp(self) -> None:
-        self.config = Config()
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.config = Config()
 
     def test_home(self):
         html_str = html.html_home("")
@@ -76,7 +79,8 @@ class TestApp(unittest.TestCase):
     def setUp(self) -> None:
         self.app = app.get_app()
         self.client = TestClient(self.app)
-        app.models = []
+        app.models = {}
+        app.next_id = itertools.count()
 
     def test_home_page_empty(self):
         response = self.client.get("/")
@@ -85,8 +89,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("New", response.text)
 
     def test_home_page_dummy(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -100,7 +104,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -114,7 +118,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
         self.assertIn("People", response.text)
@@ -158,9 +162,79 @@ class TestApp(unittest.TestCase):
         self.assertIn("Jane Smith", response.text)
         self.assertEqual(len(app.models), 2)
 
+    def test_create_contacts(self):
+        response = self.client.post(
+            "/",
+            data={
+                "name": "John Doe",
+                "age": 30,
+                "root[contacts][0][_type]": "Friend",
+                "root[contacts][0][name]": "Alice",
+                "root[contacts][0][known_since]": "2020-01-01T00:00:00Z",
+                "root[contacts][1][_type]": "FamilyMember",
+                "root[contacts][1][name]": "Bob",
+                "root[contacts][1][relationship]": "Father",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Alice [Friend]", response.text)
+        self.assertIn("Bob [FamilyMember]", response.text)
+        contacts = app.models[0].contacts
+        self.assertIsInstance(contacts[0], model.Friend)
+        self.assertEqual(contacts[0].known_since, datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC))
+        self.assertIsInstance(contacts[1], model.FamilyMember)
+        self.assertEqual(contacts[1].relationship, "Father")
+
+    def test_create_contacts_invalid_type(self):
+        for contact_type in ({"root[contacts][0][_type]": "Enemy"}, {}):
+            with self.subTest(contact_type=contact_type):
+                response = self.client.post(
+                    "/",
+                    data={
+                        "name": "John Doe",
+                        "age": 30,
+                        "root[contacts][0][name]": "Alice",
+                        "root[contacts][0][relationship]": "Sister",
+                        **contact_type,
+                    },
+                )
+                self.assertEqual(response.status_code, 422)
+                self.assertEqual(response.json()["detail"][0]["loc"][:3], ["body", "contacts", 0])
+        self.assertEqual(len(app.models), 0)
+
+    def test_create_list_in_order(self):
+        response = self.client.post(
+            "/",
+            data={
+                "name": "John Doe",
+                "age": 30,
+                "root[hobbies][0]": "Walking",
+                "root[hobbies][1]": "Reading",
+                "root[hobbies][2]": "Cooking",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(app.models[0].hobbies, ["Walking", "Reading", "Cooking"])
+
+    def test_create_list_invalid_index(self):
+        for lists, msg in (
+            ({"root[hobbies][5]": "Walking"}, "List index must not skip items"),
+            ({"root[hobbies][1]": "Reading", "root[hobbies][0]": "Walking"}, "List index must not skip items"),
+            ({"root[hobbies][first]": "Walking"}, "List index must be a number"),
+            (
+                {"root[contacts][3][_type]": "FamilyMember", "root[contacts][3][name]": "Bob"},
+                "List index must not skip items",
+            ),
+        ):
+            with self.subTest(lists=lists):
+                response = self.client.post("/", data={"name": "John Doe", "age": 30, **lists})
+                self.assertEqual(response.status_code, 422)
+                self.assertIn(msg, response.json()["detail"][0]["msg"])
+        self.assertEqual(len(app.models), 0)
+
     def test_get_page(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -174,7 +248,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -188,7 +262,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.get("/0")
         self.assertEqual(response.status_code, 200)
         self.assertIn("John Doe", response.text)
@@ -202,8 +276,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("Not Found", response.text)
 
     def test_edit_page(self):
-        app.models = [
-            model.Person(
+        app.models = {
+            0: model.Person(
                 name="John Doe",
                 age=30,
                 job="Developer",
@@ -217,7 +291,7 @@ class TestApp(unittest.TestCase):
                     city="New York",
                 ),
             ),
-            model.Person(
+            1: model.Person(
                 name="Jane Smith",
                 age=25,
                 job="UX Designer",
@@ -231,7 +305,7 @@ class TestApp(unittest.TestCase):
                     city="San Francisco",
                 ),
             ),
-        ]
+        }
         response = self.client.post(
             "/0",
             data={
@@ -262,8 +336,8 @@ class TestApp(unittest.TestCase):
         self.assertIn("Jane Doe", response.text)
         self.assertEqual(
             app.models,
-            [
-                model.Person(
+            {
+                0: model.Person(
                     name="John Smith",
                     age=31,
                     job="Programmer",
@@ -276,7 +350,7 @@ class TestApp(unittest.TestCase):
                         city="New York",
                     ),
                 ),
-                model.Person(
+                1: model.Person(
                     name="Jane Doe",
                     age=26,
                     job="UI Designer",
@@ -289,61 +363,80 @@ class TestApp(unittest.TestCase):
                         city="New York",
                     ),
                 ),
-            ],
+            },
         )
 
 
 class TestInteraction(unittest.TestCase):
-    @staticmethod
-    def run_server():
-        uvicorn.run(app.get_app(), log_level="info")
+    @classmethod
+    def setUpClass(cls) -> None:
+        (Path(__file__).parent / "results").mkdir(exist_ok=True)
+        # Run the server in this process so each test can reset the stored models
+        cls.server = uvicorn.Server(uvicorn.Config(app.get_app(), log_level="info"))
+        cls.server_thread = Thread(target=cls.server.run, daemon=True)
+        cls.server_thread.start()
+        cls.addClassCleanup(cls.stop_server)
+        # Give up if the server thread dies, e.g. because the port is already in use
+        deadline = time.monotonic() + 10
+        while not cls.server.started:
+            if not cls.server_thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        cls.playwright = sync_playwright().start()
+        cls.addClassCleanup(cls.playwright.stop)
+        cls.browser = cls.playwright.chromium.launch()
+        cls.addClassCleanup(cls.browser.close)
+
+    @classmethod
+    def stop_server(cls) -> None:
+        cls.server.should_exit = True
+        cls.server_thread.join()
 
     def setUp(self) -> None:
-        (Path(__file__).parent / "results").mkdir(exist_ok=True)
-        self.proc = Process(target=self.run_server, args=(), daemon=True)
-        self.proc.start()
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.firefox.launch()
+        app.models = {}
+        app.next_id = itertools.count()
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
         self.page.set_viewport_size({"width": 500, "height": 500})
+        self.http = httpx.Client(
+            base_url="http://127.0.0.1:8000",
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
 
     def tearDown(self) -> None:
-        self.browser.close()
-        self.playwright.stop()
-        self.proc.kill()
+        self.http.close()
+        self.context.close()
 
     def load_dummy_data(self):
         """Add some data for working with"""
-        with httpx.Client(base_url="http://127.0.0.1:8000") as client:
-            response = client.post(
-                url="/",
-                data={
-                    "name": "John Doe",
-                    "age": 30,
-                    "job": "Developer",
-                    "root[hobbies][0]": "Walking",
-                    "root[hobbies][1]": "Reading",
-                    "root[address][house_number]": 456,
-                    "root[address][street]": "Odd St",
-                    "root[address][city]": "New York",
-                },
-            )
-            self.assertEqual(response.status_code, 200)
-            response = client.post(
-                url="/",
-                data={
-                    "name": "Jane Smith",
-                    "age": 25,
-                    "job": "UX Designer",
-                    "root[hobbies][0]": "Skiing",
-                    "root[hobbies][1]": "Snowboarding",
-                    "root[address][house_number]": 5,
-                    "root[address][street]": "Main St",
-                    "root[address][city]": "New York",
-                },
-            )
-            self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={
+                "name": "John Doe",
+                "age": 30,
+                "job": "Developer",
+                "root[hobbies][0]": "Walking",
+                "root[hobbies][1]": "Reading",
+                "root[address][house_number]": 456,
+                "root[address][street]": "Odd St",
+                "root[address][city]": "New York",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.http.post(
+            url="/",
+            data={
+                "name": "Jane Smith",
+                "age": 25,
+                "job": "UX Designer",
+                "root[hobbies][0]": "Skiing",
+                "root[hobbies][1]": "Snowboarding",
+                "root[address][house_number]": 5,
+                "root[address][street]": "Main St",
+                "root[address][city]": "New York",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
 
     def test_home_page(self):
         self.page.goto("http://127.0.0.1:8000/")